@@ -5,10 +5,33 @@ WeKnoRust MCP Server Package
 A Model Context Protocol server that provides access to the WeKnoRust knowledge management API.
 """
 
-__version__ = "1.0.0"
 __author__ = "WeKnoRust Team"
 __description__ = "WeKnoRust MCP Server - Model Context Protocol server for WeKnoRust API"
 
-from .weknorust_mcp_server import WeKnoRustClient, run
+__all__ = ["WeKnoRustClient", "run"]
 
-__all__ = ["WeKnoRustClient", "run"]
\ No newline at end of file
+
+def __getattr__(name):
+    """Lazily resolve __version__ and the public names from the server module (PEP 562)"""
+    if name == "__version__":
+        # Read from installed metadata so it cannot drift from pyproject.toml
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            value = version("weknorust-mcp-server")
+        except PackageNotFoundError:
+            value = "0.0.0+unknown"
+        globals()[name] = value
+        return value
+    if name in __all__:
+        from . import weknorust_mcp_server as _server
+
+        value = getattr(_server, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """List lazy names once, whether or not they are cached in globals() yet"""
+    return sorted(set(globals()) | set(__all__) | {"__version__"})
@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+"""
+WeKnoRust MCP Server directory entry point
+
+Allows running the source directory directly (`python mcp-server`);
+all startup logic lives in main.py.
+"""
+
+import os
+import sys
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if _HERE not in sys.path:
+    sys.path.insert(0, _HERE)
+
+from main import sync_main
+
+if __name__ == "__main__":
+    sync_main()
@@ -11,48 +11,59 @@ You can run it in multiple ways:
 
 import os
 import sys
-import asyncio
-import argparse
-from pathlib import Path
+
+# Directory containing this file; invariant for the life of the process
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Option defaults, shared by the parser and the no-argument fast path
+_DEFAULTS = {"check_only": False, "verbose": False}
 
 def setup_environment():
     """Set up environment and paths"""
     # Ensure current dir is on Python path
-    current_dir = Path(__file__).parent.absolute()
-    if str(current_dir) not in sys.path:
-        sys.path.insert(0, str(current_dir))
+    if _HERE not in sys.path:
+        sys.path.insert(0, _HERE)
 
 def check_dependencies():
     """Check required dependencies are installed"""
-    try:
-        import mcp
-        import requests
-        return True
-    except ImportError as e:
-        print(f"Missing dependency: {e}")
-        print("Please run: pip install -r requirements.txt")
-        return False
+    import importlib.util
+
+    # find_spec only locates the packages; they are imported later by run()
+    for module_name in ("mcp", "requests"):
+        if importlib.util.find_spec(module_name) is None:
+            print(f"Missing dependency: {module_name}", file=sys.stderr)
+            print("Please run: pip install -r requirements.txt", file=sys.stderr)
+            return False
+    return True
 
 def check_environment_variables():
     """Check environment variable configuration"""
-    base_url = os.getenv("WEKNORUST_BASE_URL")
-    api_key = os.getenv("WEKNORUST_API_KEY")
-    
-    print("=== WeKnoRust MCP Server Environment Check ===")
-    print(f"Base URL: {base_url or 'http://localhost:8080/api/v1 (default)'}")
-    print(f"API Key: {'SET' if api_key else 'NOT SET (warning)'}")
-    
-    if not base_url:
-        print("Tip: You can set WEKNORUST_BASE_URL environment variable")
-    
-    if not api_key:
-        print("Warning: It is recommended to set WEKNORUST_API_KEY environment variable")
-    
-    print("=" * 40)
+    from weknorust_env import print_banner
+
+    print_banner()
     return True
 
+# Keep in sync with pyproject.toml; used when running from a source checkout
+_SOURCE_VERSION = "1.0.0"
+
+def get_version():
+    """Return the installed package version, or the source tree's version"""
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("weknorust-mcp-server")
+    except PackageNotFoundError:
+        return _SOURCE_VERSION
+
 def parse_arguments():
     """Parse command line arguments"""
+    if not sys.argv[1:]:
+        # Common no-flag start: use the defaults without importing argparse
+        import types
+        return types.SimpleNamespace(**_DEFAULTS)
+    
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="WeKnoRust MCP Server - Model Context Protocol server for WeKnoRust API",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -65,6 +76,7 @@ Examples:
 Environment variables:
   WEKNORUST_BASE_URL    WeKnoRust API base URL (default: http://localhost:8080/api/v1)
   WEKNORUST_API_KEY     WeKnoRust API key
+  WEKNORUST_QUIET       Set to 1 to silence startup messages (written to stderr)
         """
     )
     
@@ -83,18 +95,19 @@ Environment variables:
     parser.add_argument(
         "--version",
         action="version",
-        version="WeKnowRust MCP Server 1.0.0"
+        version=f"WeKnoRust MCP Server {get_version()}"
     )
     
+    parser.set_defaults(**_DEFAULTS)
     return parser.parse_args()
 
-async def main():
-    """Main function"""
-    args = parse_arguments()
-    
+def prepare(args):
+    """Run the synchronous startup checks; return True if the server should start"""
     # Set up environment
     setup_environment()
     
+    from weknorust_env import print_status
+    
     # Check dependencies
     if not check_dependencies():
         sys.exit(1)
@@ -104,38 +117,61 @@ async def main():
     
     # Exit if only checking environment
     if args.check_only:
-        print("Environment check complete.")
-        return
-    
-    # Configure logging level
-    if args.verbose:
-        import logging
-        logging.basicConfig(level=logging.DEBUG)
-        print("Verbose logging enabled")
+        print_status("Environment check complete.")
+        return False
+    return True
+
+async def serve(args):
+    """Import and run the MCP server"""
+    from weknorust_env import print_status
     
     try:
-        print("Starting WeKnoRust MCP Server...")
+        print_status("Starting WeKnoRust MCP Server...")
         
         # Import and run server
         from weknorust_mcp_server import run
+        
+        # Configure logging level; the server module has already installed
+        # the root handler, so only the level needs raising
+        if args.verbose:
+            import logging
+            logging.getLogger().setLevel(logging.DEBUG)
+            print_status("Verbose logging enabled")
+        
         await run()
         
     except ImportError as e:
-        print(f"Import error: {e}")
-        print("Please ensure all files are in the correct locations")
+        print(f"Import error: {e}", file=sys.stderr)
+        print("Please ensure all files are in the correct locations", file=sys.stderr)
         sys.exit(1)
     except KeyboardInterrupt:
-        print("\nServer stopped")
+        print_status("\nServer stopped")
     except Exception as e:
-        print(f"Server runtime error: {e}")
+        print(f"Server runtime error: {e}", file=sys.stderr)
         if args.verbose:
             import traceback
             traceback.print_exc()
         sys.exit(1)
 
+async def main(args=None):
+    """Main function"""
+    if args is None:
+        args = parse_arguments()
+    
+    if prepare(args):
+        await serve(args)
+
 def sync_main():
     """Synchronous entry point for entry_points"""
-    asyncio.run(main())
+    # --help/--version exit while parsing and --check-only returns from
+    # prepare(), so asyncio is only imported when the server actually starts
+    args = parse_arguments()
+    if not prepare(args):
+        return
+    
+    import asyncio
+
+    asyncio.run(serve(args))
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    sync_main()
\ No newline at end of file
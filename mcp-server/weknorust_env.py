@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+WeKnoRust MCP Server environment helpers
+
+Shared by the startup scripts so the environment is read and reported in one place.
+Startup messages go to stderr, since stdout carries the MCP stdio protocol stream.
+Set WEKNORUST_QUIET=1 to silence them.
+"""
+
+import os
+import sys
+import functools
+
+DEFAULT_BASE_URL = "http://localhost:8080/api/v1"
+
+# Read the mapping directly rather than going through os.getenv()
+_ENV = os.environ
+
+@functools.lru_cache(maxsize=1)
+def _read_env():
+    """Read raw environment values once per process (legacy WEKNOWRUST_* names accepted)"""
+    base_url = _ENV.get("WEKNORUST_BASE_URL") or _ENV.get("WEKNOWRUST_BASE_URL") or ""
+    api_key = _ENV.get("WEKNORUST_API_KEY") or _ENV.get("WEKNOWRUST_API_KEY") or ""
+    return base_url, api_key
+
+def is_quiet():
+    """Return True when startup messages are disabled via WEKNORUST_QUIET=1"""
+    return _ENV.get("WEKNORUST_QUIET") == "1"
+
+def print_status(message):
+    """Print a startup status message to stderr unless quiet"""
+    if not is_quiet():
+        print(message, file=sys.stderr)
+
+def print_banner():
+    """Print the environment configuration banner to stderr unless quiet"""
+    if is_quiet():
+        return
+
+    base_url, api_key = _read_env()
+
+    lines = [
+        "=== WeKnoRust MCP Server Environment Check ===",
+        f"Base URL: {base_url or DEFAULT_BASE_URL + ' (default)'}",
+        f"API Key: {'SET' if api_key else 'NOT SET (warning)'}",
+    ]
+    if not base_url:
+        lines.append("Tip: You can set WEKNORUST_BASE_URL environment variable")
+    if not api_key:
+        lines.append("Warning: It is recommended to set WEKNORUST_API_KEY environment variable")
+    lines.append("=" * 40)
+
+    print("\n".join(lines), file=sys.stderr)
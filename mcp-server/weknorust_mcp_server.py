@@ -23,10 +23,10 @@ logger = logging.getLogger(__name__)
 
 # Configuration (backward compatible)
 def _get_env(name_new: str, name_old: str, default: str = "") -> str:
-    value = os.getenv(name_new)
+    value = os.environ.get(name_new)
     if value is not None and value != "":
         return value
-    value = os.getenv(name_old)
+    value = os.environ.get(name_old)
     if value is not None and value != "":
         return value
     return default